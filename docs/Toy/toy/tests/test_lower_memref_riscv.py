@@ -75,9 +75,8 @@ def test_insert_shape_ops_1d():
     @Builder.implicit_region
     def expected_1d():
         with ImplicitBuilder(func.FuncOp("impl", ((), ())).body):
-            bytes_per_element = riscv.LiOp(4).rd
-            offset_in_bytes = riscv.MulOp(
-                indices[0], bytes_per_element, comment="multiply by element size"
+            offset_in_bytes = riscv.SlliOp(
+                indices[0], 2, comment="multiply by element size"
             ).rd
             _ = riscv.AddOp(mem, offset_in_bytes)
             riscv.CustomAssemblyInstructionOp("some_memref_op", (), ())
@@ -105,12 +104,10 @@ def test_insert_shape_ops_2d():
     @Builder.implicit_region
     def expected_2d():
         with ImplicitBuilder(func.FuncOp("impl", ((), ())).body):
-            v1 = riscv.LiOp(2)
-            v2 = riscv.MulOp(v1, indices[0])
-            v3 = riscv.AddOp(v2, indices[1])
-            v4 = riscv.LiOp(4).rd
-            v5 = riscv.MulOp(v3, v4, comment="multiply by element size").rd
-            _ = riscv.AddOp(mem, v5)
+            v1 = riscv.SlliOp(indices[0], 1)
+            v2 = riscv.AddOp(v1, indices[1])
+            v3 = riscv.SlliOp(v2, 2, comment="multiply by element size").rd
+            _ = riscv.AddOp(mem, v3)
             riscv.CustomAssemblyInstructionOp("some_memref_op", (), ())
 
     shape = [2, 2]
@@ -14,42 +14,82 @@ builtin.module {
 // CHECK-NEXT:   %1 = builtin.unrealized_conversion_cast %m_f32 : memref<3x2xf32> to !riscv.reg<>
 // CHECK-NEXT:   %2 = builtin.unrealized_conversion_cast %r : index to !riscv.reg<>
 // CHECK-NEXT:   %3 = builtin.unrealized_conversion_cast %c : index to !riscv.reg<>
-// CHECK-NEXT:   %4 = riscv.li 2 : () -> !riscv.reg<>
-// CHECK-NEXT:   %5 = riscv.mul %4, %2 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %6 = riscv.add %5, %3 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %7 = riscv.li 4 : () -> !riscv.reg<>
-// CHECK-NEXT:   %8 = riscv.mul %6, %7 {"comment" = "multiply by element size"} : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %9 = riscv.add %1, %8 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   riscv.fsw %9, %0, 0 {"comment" = "store float value to memref of shape (3, 2)"} : (!riscv.reg<>, !riscv.freg<>) -> ()
-// CHECK-NEXT:   %10 = builtin.unrealized_conversion_cast %m_f32 : memref<3x2xf32> to !riscv.reg<>
-// CHECK-NEXT:   %11 = builtin.unrealized_conversion_cast %r : index to !riscv.reg<>
-// CHECK-NEXT:   %12 = builtin.unrealized_conversion_cast %c : index to !riscv.reg<>
-// CHECK-NEXT:   %13 = riscv.li 2 : () -> !riscv.reg<>
-// CHECK-NEXT:   %14 = riscv.mul %13, %11 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %15 = riscv.add %14, %12 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %16 = riscv.li 4 : () -> !riscv.reg<>
-// CHECK-NEXT:   %17 = riscv.mul %15, %16 {"comment" = "multiply by element size"} : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %18 = riscv.add %10, %17 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %x_f32 = riscv.flw %18, 0 {"comment" = "load value from memref of shape (3, 2)"} : (!riscv.reg<>) -> !riscv.freg<>
+// CHECK-NEXT:   %4 = riscv.slli %2, 1 : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %5 = riscv.add %4, %3 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %6 = riscv.slli %5, 2 {"comment" = "multiply by element size"} : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %7 = riscv.add %1, %6 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   riscv.fsw %7, %0, 0 {"comment" = "store float value to memref of shape (3, 2)"} : (!riscv.reg<>, !riscv.freg<>) -> ()
+// CHECK-NEXT:   %8 = riscv.slli %2, 1 : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %9 = riscv.add %8, %3 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %10 = riscv.slli %9, 2 {"comment" = "multiply by element size"} : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %11 = riscv.add %1, %10 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %x_f32 = riscv.flw %11, 0 {"comment" = "load value from memref of shape (3, 2)"} : (!riscv.reg<>) -> !riscv.freg<>
 // CHECK-NEXT:   %x_f32_1 = builtin.unrealized_conversion_cast %x_f32 : !riscv.freg<> to f32
-// CHECK-NEXT:   %19 = builtin.unrealized_conversion_cast %v_i32 : i32 to !riscv.reg<>
-// CHECK-NEXT:   %20 = builtin.unrealized_conversion_cast %m_i32 : memref<3xi32> to !riscv.reg<>
-// CHECK-NEXT:   %21 = builtin.unrealized_conversion_cast %c : index to !riscv.reg<>
-// CHECK-NEXT:   %22 = riscv.li 4 : () -> !riscv.reg<>
-// CHECK-NEXT:   %23 = riscv.mul %21, %22 {"comment" = "multiply by element size"} : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %24 = riscv.add %20, %23 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   riscv.sw %24, %19, 0 {"comment" = "store int value to memref of shape (3,)"} : (!riscv.reg<>, !riscv.reg<>) -> ()
-// CHECK-NEXT:   %25 = builtin.unrealized_conversion_cast %m_i32 : memref<3xi32> to !riscv.reg<>
-// CHECK-NEXT:   %26 = builtin.unrealized_conversion_cast %c : index to !riscv.reg<>
-// CHECK-NEXT:   %27 = riscv.li 4 : () -> !riscv.reg<>
-// CHECK-NEXT:   %28 = riscv.mul %26, %27 {"comment" = "multiply by element size"} : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %29 = riscv.add %25, %28 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
-// CHECK-NEXT:   %x_i32 = riscv.lw %29, 0 {"comment" = "load value from memref of shape (3,)"} : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %12 = builtin.unrealized_conversion_cast %v_i32 : i32 to !riscv.reg<>
+// CHECK-NEXT:   %13 = builtin.unrealized_conversion_cast %m_i32 : memref<3xi32> to !riscv.reg<>
+// CHECK-NEXT:   %14 = riscv.slli %3, 2 {"comment" = "multiply by element size"} : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %15 = riscv.add %13, %14 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   riscv.sw %15, %12, 0 {"comment" = "store int value to memref of shape (3,)"} : (!riscv.reg<>, !riscv.reg<>) -> ()
+// CHECK-NEXT:   %16 = riscv.slli %3, 2 {"comment" = "multiply by element size"} : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %17 = riscv.add %13, %16 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %x_i32 = riscv.lw %17, 0 {"comment" = "load value from memref of shape (3,)"} : (!riscv.reg<>) -> !riscv.reg<>
 // CHECK-NEXT:   %x_i32_1 = builtin.unrealized_conversion_cast %x_i32 : !riscv.reg<> to i32
 // CHECK-NEXT: }
 
 // -----
 
+builtin.module {
+    %v, %r, %c, %m = "test.op"() : () -> (f32, index, index, memref<2x3xf32>)
+    "memref.store"(%v, %m, %r, %c) {"nontemporal" = false} : (f32, memref<2x3xf32>, index, index) -> ()
+    %x = "memref.load"(%m, %c, %r) {"nontemporal" = false} : (memref<2x3xf32>, index, index) -> (f32)
+}
+
+// CHECK:      builtin.module {
+// CHECK-NEXT:   %v, %r, %c, %m = "test.op"() : () -> (f32, index, index, memref<2x3xf32>)
+// CHECK-NEXT:   %0 = builtin.unrealized_conversion_cast %v : f32 to !riscv.freg<>
+// CHECK-NEXT:   %1 = builtin.unrealized_conversion_cast %m : memref<2x3xf32> to !riscv.reg<>
+// CHECK-NEXT:   %2 = builtin.unrealized_conversion_cast %r : index to !riscv.reg<>
+// CHECK-NEXT:   %3 = builtin.unrealized_conversion_cast %c : index to !riscv.reg<>
+// CHECK-NEXT:   %4 = riscv.li 3 : () -> !riscv.reg<>
+// CHECK-NEXT:   %5 = riscv.mul %2, %4 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %6 = riscv.add %5, %3 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %7 = riscv.slli %6, 2 {"comment" = "multiply by element size"} : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %8 = riscv.add %1, %7 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   riscv.fsw %8, %0, 0 {"comment" = "store float value to memref of shape (2, 3)"} : (!riscv.reg<>, !riscv.freg<>) -> ()
+// CHECK-NEXT:   %9 = riscv.mul %3, %4 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %10 = riscv.add %9, %2 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %11 = riscv.slli %10, 2 {"comment" = "multiply by element size"} : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %12 = riscv.add %1, %11 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %x = riscv.flw %12, 0 {"comment" = "load value from memref of shape (2, 3)"} : (!riscv.reg<>) -> !riscv.freg<>
+// CHECK-NEXT:   %x_1 = builtin.unrealized_conversion_cast %x : !riscv.freg<> to f32
+// CHECK-NEXT: }
+
+// -----
+
+builtin.module {
+    %v, %r, %m = "test.op"() : () -> (f32, index, memref<3x2xf32>)
+    %c = riscv.li 1 : () -> !riscv.reg<>
+    %c_index = builtin.unrealized_conversion_cast %c : !riscv.reg<> to index
+    "memref.store"(%v, %m, %r, %c_index) {"nontemporal" = false} : (f32, memref<3x2xf32>, index, index) -> ()
+}
+
+// CHECK:      builtin.module {
+// CHECK-NEXT:   %v, %r, %m = "test.op"() : () -> (f32, index, memref<3x2xf32>)
+// CHECK-NEXT:   %c = riscv.li 1 : () -> !riscv.reg<>
+// CHECK-NEXT:   %c_index = builtin.unrealized_conversion_cast %c : !riscv.reg<> to index
+// CHECK-NEXT:   %0 = builtin.unrealized_conversion_cast %v : f32 to !riscv.freg<>
+// CHECK-NEXT:   %1 = builtin.unrealized_conversion_cast %m : memref<3x2xf32> to !riscv.reg<>
+// CHECK-NEXT:   %2 = builtin.unrealized_conversion_cast %r : index to !riscv.reg<>
+// CHECK-NEXT:   %3 = builtin.unrealized_conversion_cast %c_index : index to !riscv.reg<>
+// CHECK-NEXT:   %4 = riscv.slli %2, 1 : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %5 = riscv.addi %4, 1 : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %6 = riscv.slli %5, 2 {"comment" = "multiply by element size"} : (!riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   %7 = riscv.add %1, %6 : (!riscv.reg<>, !riscv.reg<>) -> !riscv.reg<>
+// CHECK-NEXT:   riscv.fsw %7, %0, 0 {"comment" = "store float value to memref of shape (3, 2)"} : (!riscv.reg<>, !riscv.freg<>) -> ()
+// CHECK-NEXT: }
+
+// -----
+
 builtin.module {
     %m = "memref.alloc"() {"operand_segment_sizes" = array<i32: 0, 0>} : () -> memref<1x1xf32>
 }
@@ -34,6 +34,9 @@ builtin.module {
   %shift_left_immediate = riscv.slli %2, 4 : (!riscv.reg<>) -> !riscv.reg<a0>
   "test.op"(%shift_left_immediate) : (!riscv.reg<a0>) -> ()
 
+  %add_immediate_constant = riscv.addi %2, 1 : (!riscv.reg<>) -> !riscv.reg<a0>
+  "test.op"(%add_immediate_constant) : (!riscv.reg<a0>) -> ()
+
   %load_float_ptr = riscv.addi %i2, 8 : (!riscv.reg<>) -> !riscv.reg<>
   %load_float_known_offset = riscv.flw %load_float_ptr, 4 : (!riscv.reg<>) -> !riscv.freg<fa0>
   "test.op"(%load_float_known_offset) : (!riscv.freg<fa0>) -> ()
@@ -71,6 +74,9 @@ builtin.module {
 // CHECK-NEXT:   %shift_left_immediate = riscv.li 32 : () -> !riscv.reg<a0>
 // CHECK-NEXT:   "test.op"(%shift_left_immediate) : (!riscv.reg<a0>) -> ()
 
+// CHECK-NEXT:   %add_immediate_constant = riscv.li 3 : () -> !riscv.reg<a0>
+// CHECK-NEXT:   "test.op"(%add_immediate_constant) : (!riscv.reg<a0>) -> ()
+
 // CHECK-NEXT:   %load_float_known_offset = riscv.flw %i2, 12 : (!riscv.reg<>) -> !riscv.freg<fa0>
 // CHECK-NEXT:   "test.op"(%load_float_known_offset) : (!riscv.freg<fa0>) -> ()
 
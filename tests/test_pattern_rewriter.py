@@ -1,3 +1,4 @@
+import pytest
 from conftest import assert_print_op
 
 from xdsl.dialects import test
@@ -22,6 +23,7 @@ from xdsl.pattern_rewriter import (
     TypeConversionPattern,
     attr_type_rewrite_pattern,
     op_type_rewrite_pattern,
+    pattern_may_match,
 )
 from xdsl.utils.hints import isa
 
@@ -249,6 +251,73 @@ def test_greedy_rewrite_pattern_applier():
     )
 
 
+def test_pattern_may_match():
+    """Test that op_type_rewrite_pattern patterns are filtered on operation type."""
+
+    class ConstantRewrite(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: Constant, rewriter: PatternRewriter):
+            pass
+
+    class AddiOrMuliRewrite(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: Addi | Muli, rewriter: PatternRewriter):
+            pass
+
+    class AnyRewrite(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            pass
+
+    assert pattern_may_match(ConstantRewrite(), Constant)
+    assert not pattern_may_match(ConstantRewrite(), Addi)
+    assert pattern_may_match(AddiOrMuliRewrite(), Addi)
+    assert pattern_may_match(AddiOrMuliRewrite(), Muli)
+    assert not pattern_may_match(AddiOrMuliRewrite(), Constant)
+    assert pattern_may_match(AnyRewrite(), Constant)
+
+    applier = GreedyRewritePatternApplier([ConstantRewrite(), AddiOrMuliRewrite()])
+    assert pattern_may_match(applier, Constant)
+    assert pattern_may_match(applier, Muli)
+    assert not pattern_may_match(applier, test.TestOp)
+
+
+@pytest.mark.parametrize("walk_regions_first", [False, True])
+def test_walker_skips_unmatched_op_types(walk_regions_first: bool):
+    """
+    Test that the walker does not try op_type_rewrite_pattern patterns on operations
+    they cannot match, while still rewriting operations nested in their regions.
+    """
+
+    prog = """"builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 42 : i32} : () -> i32
+  "test.op"() ({
+    %1 = "arith.constant"() {"value" = 42 : i32} : () -> i32
+  }) : () -> ()
+}) : () -> ()"""
+
+    expected = """"builtin.module"() ({
+  %0 = "arith.constant"() {"value" = 43 : i32} : () -> i32
+  "test.op"() ({
+    %1 = "arith.constant"() {"value" = 43 : i32} : () -> i32
+  }) : () -> ()
+}) : () -> ()"""
+
+    class RewriteConst(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: Constant, rewriter: PatternRewriter):
+            if op.value != IntegerAttr(43, i32):
+                rewriter.replace_matched_op(Constant.from_int_and_width(43, i32))
+
+    walker = PatternRewriteWalker(RewriteConst(), walk_regions_first=walk_regions_first)
+    rewrite_and_compare(prog, expected, walker)
+
+    assert walker._may_match_op_type == {  # pyright: ignore[reportPrivateUsage]
+        ModuleOp: False,
+        test.TestOp: False,
+        Constant: True,
+    }
+
+
 def test_insert_op_before_matched_op():
     """Test rewrites where operations are inserted before the matched operation."""
 
@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any, cast
 
 from xdsl.backend.riscv.lowering.utils import (
@@ -8,15 +9,15 @@ from xdsl.backend.riscv.lowering.utils import (
 from xdsl.dialects import memref, riscv
 from xdsl.dialects.builtin import (
     Float32Type,
+    IntegerAttr,
     IntegerType,
     ModuleOp,
     UnrealizedConversionCastOp,
 )
-from xdsl.ir import MLContext, Operation, SSAValue
+from xdsl.ir import Block, MLContext, Operation, OpResult, SSAValue
 from xdsl.ir.core import Attribute
 from xdsl.passes import ModulePass
 from xdsl.pattern_rewriter import (
-    GreedyRewritePatternApplier,
     PatternRewriter,
     PatternRewriteWalker,
     RewritePattern,
@@ -24,17 +25,71 @@ from xdsl.pattern_rewriter import (
 )
 from xdsl.utils.exceptions import DiagnosticException
 
+_FLOAT_BYTES_PER_ELEMENT: dict[type[Attribute], int] = {Float32Type: 4}
+"""Size in bytes of the supported floating point memref element types."""
 
-class ConvertMemrefAllocOp(RewritePattern):
-    @op_type_rewrite_pattern
-    def match_and_rewrite(self, op: memref.Alloc, rewriter: PatternRewriter) -> None:
-        raise DiagnosticException("Lowering memref.alloc not implemented yet")
 
+def bytes_per_element(element_type: Attribute) -> int:
+    """
+    Returns the size in bytes of a memref element type supported by the riscv
+    lowering, raises a DiagnosticException otherwise.
+    """
+    if isinstance(element_type, IntegerType):
+        if element_type.width.data == 32:
+            return 4
+    elif (size := _FLOAT_BYTES_PER_ELEMENT.get(type(element_type))) is not None:
+        return size
+    raise DiagnosticException(
+        f"Unsupported memref element type for riscv lowering: {element_type}"
+    )
 
-class ConvertMemrefDeallocOp(RewritePattern):
-    @op_type_rewrite_pattern
-    def match_and_rewrite(self, op: memref.Dealloc, rewriter: PatternRewriter) -> None:
-        raise DiagnosticException("Lowering memref.dealloc not implemented yet")
+
+def multiply_by_constant(
+    value: SSAValue,
+    factor: int,
+    comment: str | None = None,
+    immediates: dict[int, SSAValue] | None = None,
+) -> tuple[list[Operation], SSAValue]:
+    """
+    Returns operations computing `value * factor`, and the resulting value.
+    Multiplication by one is elided, and powers of two are lowered to a shift.
+    Other factors are loaded into a register, reusing the one in `immediates` if
+    present, and recording the newly loaded one otherwise.
+    """
+    if factor == 1:
+        return [], value
+    if factor > 0 and not factor & (factor - 1):
+        shift = riscv.SlliOp(value, factor.bit_length() - 1, comment=comment)
+        return [shift], shift.rd
+    ops: list[Operation] = []
+    if immediates is None or (factor_reg := immediates.get(factor)) is None:
+        ops.append(factor_op := riscv.LiOp(factor))
+        factor_reg = factor_op.rd
+        if immediates is not None:
+            immediates[factor] = factor_reg
+    ops.append(mul := riscv.MulOp(value, factor_reg, comment=comment))
+    return ops, mul.rd
+
+
+def small_constant(value: SSAValue) -> int | None:
+    """
+    Returns the value loaded by `value` if it is the result of a `riscv.li` of an
+    integer that fits in a 12-bit signed immediate, looking through the unrealized
+    casts inserted by the lowerings, and None otherwise.
+    """
+    while (
+        isinstance(value, OpResult)
+        and isinstance(cast_op := value.op, UnrealizedConversionCastOp)
+        and len(cast_op.inputs) == 1
+    ):
+        value = cast_op.inputs[0]
+    if not isinstance(value, OpResult) or not isinstance(li := value.op, riscv.LiOp):
+        return None
+    if not isinstance(immediate := li.immediate, IntegerAttr):
+        return None
+    if -2048 <= (constant := immediate.value.data) < 2048:
+        return constant
+    return None
 
 
 def memref_shape_ops(
@@ -42,74 +97,98 @@ def memref_shape_ops(
     indices: Sequence[SSAValue],
     shape: Sequence[int],
     element_type: Attribute,
+    immediates: dict[int, SSAValue] | None = None,
 ) -> tuple[list[Operation], SSAValue]:
     """
     Returns ssa value representing pointer into the memref at given indices.
     The pointer is byte-indexed, and the indices are strided by element size, so the index
     into the flat memory buffer needs to be multiplied by the size of the element.
+    Constants already loaded into registers can be passed in `immediates` to be reused.
     """
 
     assert len(shape) == len(indices)
 
-    # Only handle a small subset of elements
-    # Might be useful as a helper for other passes in the future
-    match element_type:
-        case IntegerType():
-            bitwidth = element_type.width.data
-            if bitwidth != 32:
-                raise DiagnosticException(
-                    f"Unsupported memref element type for riscv lowering: {element_type}"
-                )
-            bytes_per_element = element_type.width.data // 8
-        case Float32Type():
-            bytes_per_element = 4
-        case _:
-            raise DiagnosticException(
-                f"Unsupported memref element type for riscv lowering: {element_type}"
-            )
-
-    ops: list[Operation] = []
+    element_size = bytes_per_element(element_type)
 
     match indices:
         case [offset_in_elements]:
-            pass
+            ops: list[Operation] = []
         case [idx1, idx2]:
-            ops = [
-                cols := riscv.LiOp(shape[1]),
-                row_offset := riscv.MulOp(cols, idx1),
-                offset := riscv.AddOp(row_offset, idx2),
-            ]
+            ops, row_offset = multiply_by_constant(
+                idx1, shape[1], immediates=immediates
+            )
+            if (column := small_constant(idx2)) is not None:
+                offset = riscv.AddiOp(row_offset, column)
+            else:
+                offset = riscv.AddOp(row_offset, idx2)
+            ops.append(offset)
             offset_in_elements = offset.rd
         case _:
             raise DiagnosticException(
                 f"Unsupported memref shape {shape}, only support 1D and 2D memrefs."
             )
 
-    ops.extend(
-        [
-            bytes_per_element_op := riscv.LiOp(bytes_per_element),
-            offset_bytes := riscv.MulOp(
-                offset_in_elements,
-                bytes_per_element_op.rd,
-                comment="multiply by element size",
-            ),
-            ptr := riscv.AddOp(mem, offset_bytes),
-        ]
+    scale_ops, offset_bytes = multiply_by_constant(
+        offset_in_elements,
+        element_size,
+        comment="multiply by element size",
+        immediates=immediates,
     )
+    ptr = riscv.AddOp(mem, offset_bytes)
+    ops += (*scale_ops, ptr)
 
     return ops, ptr.rd
 
 
-class ConvertMemrefStoreOp(RewritePattern):
+@dataclass
+class ConvertMemrefOp(RewritePattern):
+    """
+    Lowers all supported memref operations, dispatching on the type of the matched
+    operation so that the walker only tries a single pattern per operation.
+    """
+
+    register_casts: dict[tuple[Block, SSAValue], SSAValue] = field(default_factory=dict)
+    """Register casts already inserted in each block, reused by later accesses."""
+
+    immediates: dict[Block, dict[int, SSAValue]] = field(default_factory=dict)
+    """Constants already loaded into registers in each block."""
+
     @op_type_rewrite_pattern
-    def match_and_rewrite(self, op: memref.Store, rewriter: PatternRewriter):
-        value, mem, *indices = cast_operands_to_regs(rewriter)
+    def match_and_rewrite(
+        self,
+        op: memref.Alloc | memref.Dealloc | memref.Store | memref.Load,
+        rewriter: PatternRewriter,
+    ) -> None:
+        match op:
+            case memref.Alloc():
+                self.rewrite_alloc(op, rewriter)
+            case memref.Dealloc():
+                self.rewrite_dealloc(op, rewriter)
+            case memref.Store():
+                self.rewrite_store(op, rewriter)
+            case memref.Load():
+                self.rewrite_load(op, rewriter)
+
+    def _immediates_for(self, op: Operation) -> dict[int, SSAValue] | None:
+        block = op.parent_block()
+        return None if block is None else self.immediates.setdefault(block, {})
+
+    def rewrite_alloc(self, op: memref.Alloc, rewriter: PatternRewriter) -> None:
+        raise DiagnosticException("Lowering memref.alloc not implemented yet")
+
+    def rewrite_dealloc(self, op: memref.Dealloc, rewriter: PatternRewriter) -> None:
+        raise DiagnosticException("Lowering memref.dealloc not implemented yet")
 
-        assert isinstance(op.memref.type, memref.MemRefType)
+    def rewrite_store(self, op: memref.Store, rewriter: PatternRewriter) -> None:
+        value, mem, *indices = cast_operands_to_regs(rewriter, self.register_casts)
+
+        # The operand definition constrains the type, so this holds for verified ops
         memref_type = cast(memref.MemRefType[Any], op.memref.type)
         shape = memref_type.get_shape()
 
-        ops, ptr = memref_shape_ops(mem, indices, shape, memref_type.element_type)
+        ops, ptr = memref_shape_ops(
+            mem, indices, shape, memref_type.element_type, self._immediates_for(op)
+        )
 
         rewriter.insert_op_before_matched_op(ops)
         if isinstance(value.type, riscv.IntRegisterType):
@@ -122,16 +201,15 @@ class ConvertMemrefStoreOp(RewritePattern):
             )
         rewriter.replace_matched_op(new_op)
 
+    def rewrite_load(self, op: memref.Load, rewriter: PatternRewriter) -> None:
+        mem, *indices = cast_operands_to_regs(rewriter, self.register_casts)
 
-class ConvertMemrefLoadOp(RewritePattern):
-    @op_type_rewrite_pattern
-    def match_and_rewrite(self, op: memref.Load, rewriter: PatternRewriter):
-        mem, *indices = cast_operands_to_regs(rewriter)
-
-        assert isinstance(op.memref.type, memref.MemRefType)
+        # The operand definition constrains the type, so this holds for verified ops
         memref_type = cast(memref.MemRefType[Any], op.memref.type)
         shape = memref_type.get_shape()
-        ops, ptr = memref_shape_ops(mem, indices, shape, memref_type.element_type)
+        ops, ptr = memref_shape_ops(
+            mem, indices, shape, memref_type.element_type, self._immediates_for(op)
+        )
         rewriter.insert_op_before_matched_op(ops)
 
         result_register_type = register_type_for_type(op.res.type)
@@ -157,13 +235,4 @@ class ConvertMemrefToRiscvPass(ModulePass):
     name = "convert-memref-to-riscv"
 
     def apply(self, ctx: MLContext, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ConvertMemrefAllocOp(),
-                    ConvertMemrefDeallocOp(),
-                    ConvertMemrefStoreOp(),
-                    ConvertMemrefLoadOp(),
-                ]
-            )
-        ).rewrite_module(op)
+        PatternRewriteWalker(ConvertMemrefOp()).rewrite_module(op)
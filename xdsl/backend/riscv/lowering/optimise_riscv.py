@@ -100,6 +100,25 @@ class AddImmediates(RewritePattern):
                 pass
 
 
+class AddImmediateConstant(RewritePattern):
+    @op_type_rewrite_pattern
+    def match_and_rewrite(self, op: riscv.AddiOp, rewriter: PatternRewriter) -> None:
+        if (
+            isinstance(op.rs1, OpResult)
+            and isinstance(op.rs1.op, riscv.LiOp)
+            and isinstance(op.rs1.op.immediate, IntegerAttr)
+            and isinstance(op.immediate, IntegerAttr)
+        ):
+            rd = cast(riscv.IntRegisterType, op.rd.type)
+            rewriter.replace_matched_op(
+                riscv.LiOp(
+                    op.rs1.op.immediate.value.data + op.immediate.value.data,
+                    rd=rd,
+                    comment=op.comment,
+                )
+            )
+
+
 class ShiftLeftImmediate(RewritePattern):
     @op_type_rewrite_pattern
     def match_and_rewrite(self, op: riscv.SlliOp, rewriter: PatternRewriter) -> None:
@@ -4,6 +4,11 @@ from xdsl.dialects import builtin, riscv
 from xdsl.ir import Attribute, Block, Operation, SSAValue
 from xdsl.pattern_rewriter import PatternRewriter
 
+_REGISTER_TYPE_FOR_ATTRIBUTE_TYPE: dict[
+    type[Attribute], type[riscv.IntRegisterType] | type[riscv.FloatRegisterType]
+] = {}
+"""Cache of the register type used for each attribute class."""
+
 
 def register_type_for_type(
     attr: Attribute,
@@ -11,11 +16,17 @@ def register_type_for_type(
     """
     Returns the appropriate register fype for a given input type.
     """
-    if isinstance(attr, riscv.IntRegisterType | riscv.FloatRegisterType):
-        return type(attr)
-    if isinstance(attr, builtin.AnyFloat):
-        return riscv.FloatRegisterType
-    return riscv.IntRegisterType
+    attr_type = type(attr)
+    register_type = _REGISTER_TYPE_FOR_ATTRIBUTE_TYPE.get(attr_type)
+    if register_type is None:
+        if issubclass(attr_type, riscv.IntRegisterType | riscv.FloatRegisterType):
+            register_type = attr_type
+        elif issubclass(attr_type, builtin.AnyFloat):
+            register_type = riscv.FloatRegisterType
+        else:
+            register_type = riscv.IntRegisterType
+        _REGISTER_TYPE_FOR_ATTRIBUTE_TYPE[attr_type] = register_type
+    return register_type
 
 
 def cast_to_regs(values: Iterable[SSAValue]) -> tuple[list[Operation], list[SSAValue]]:
@@ -95,25 +106,43 @@ def move_to_unallocated_regs(
     return new_ops, new_values
 
 
-def cast_operands_to_regs(rewriter: PatternRewriter) -> list[SSAValue]:
+def cast_operands_to_regs(
+    rewriter: PatternRewriter,
+    cast_cache: dict[tuple[Block, SSAValue], SSAValue] | None = None,
+) -> list[SSAValue]:
     """
     Add cast operations just before the targeted operation
-    if the operands were not already int registers
+    if the operands were not already int registers.
+
+    If a cast_cache is provided, casts already inserted earlier in the same block
+    are reused, and the newly inserted casts are recorded in it. The cache is only
+    valid while the block is rewritten in order, so it should not outlive a walk.
     """
 
     new_ops = list[Operation]()
     new_operands = list[SSAValue]()
+    block = rewriter.current_operation.parent_block()
 
     for operand in rewriter.current_operation.operands:
         if not isinstance(
             operand.type, riscv.IntRegisterType | riscv.FloatRegisterType
         ):
-            new_type = register_type_for_type(operand.type)
-            cast_op = builtin.UnrealizedConversionCastOp.get(
-                (operand,), (new_type.unallocated(),)
-            )
-            new_ops.append(cast_op)
-            operand = cast_op.results[0]
+            if cast_cache is None or block is None:
+                cached = None
+            else:
+                cached = cast_cache.get((block, operand))
+
+            if cached is None:
+                new_type = register_type_for_type(operand.type)
+                cast_op = builtin.UnrealizedConversionCastOp.get(
+                    (operand,), (new_type.unallocated(),)
+                )
+                new_ops.append(cast_op)
+                if cast_cache is not None and block is not None:
+                    cast_cache[(block, operand)] = cast_op.results[0]
+                operand = cast_op.results[0]
+            else:
+                operand = cached
 
         new_operands.append(operand)
 
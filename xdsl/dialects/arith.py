@@ -314,6 +314,41 @@ class ShRSI(SignlessIntegerBinaryOp):
     name = "arith.shrsi"
 
 
+_CMPI_COMPARISON_OPERATIONS: dict[str, int] = {
+    "eq": 0,
+    "ne": 1,
+    "slt": 2,
+    "sle": 3,
+    "sgt": 4,
+    "sge": 5,
+    "ult": 6,
+    "ule": 7,
+    "ugt": 8,
+    "uge": 9,
+}
+"""Integer value of each `arith.cmpi` predicate mnemonic."""
+
+_CMPF_COMPARISON_OPERATIONS: dict[str, int] = {
+    "false": 0,
+    "oeq": 1,
+    "ogt": 2,
+    "oge": 3,
+    "olt": 4,
+    "ole": 5,
+    "one": 6,
+    "ord": 7,
+    "ueq": 8,
+    "ugt": 9,
+    "uge": 10,
+    "ult": 11,
+    "ule": 12,
+    "une": 13,
+    "uno": 14,
+    "true": 15,
+}
+"""Integer value of each `arith.cmpf` predicate mnemonic."""
+
+
 @dataclass
 class ComparisonOperation:
     """
@@ -338,10 +373,10 @@ class ComparisonOperation:
     def _get_comparison_predicate(
         mnemonic: str, comparison_operations: dict[str, int]
     ) -> int:
-        if mnemonic in comparison_operations:
-            return comparison_operations[mnemonic]
-        else:
+        predicate = comparison_operations.get(mnemonic)
+        if predicate is None:
             raise VerifyException(f"Unknown comparison mnemonic: {mnemonic}")
+        return predicate
 
     @staticmethod
     def _validate_operand_types(operand1: SSAValue, operand2: SSAValue):
@@ -398,19 +433,7 @@ class Cmpi(IRDLOperation, ComparisonOperation):
         Cmpi._validate_operand_types(operand1, operand2)
 
         if isinstance(arg, str):
-            cmpi_comparison_operations = {
-                "eq": 0,
-                "ne": 1,
-                "slt": 2,
-                "sle": 3,
-                "sgt": 4,
-                "sge": 5,
-                "ult": 6,
-                "ule": 7,
-                "ugt": 8,
-                "uge": 9,
-            }
-            arg = Cmpi._get_comparison_predicate(arg, cmpi_comparison_operations)
+            arg = Cmpi._get_comparison_predicate(arg, _CMPI_COMPARISON_OPERATIONS)
 
         return super().__init__(
             operands=[operand1, operand2],
@@ -463,25 +486,7 @@ class Cmpf(IRDLOperation, ComparisonOperation):
         Cmpf._validate_operand_types(operand1, operand2)
 
         if isinstance(arg, str):
-            cmpf_comparison_operations = {
-                "false": 0,
-                "oeq": 1,
-                "ogt": 2,
-                "oge": 3,
-                "olt": 4,
-                "ole": 5,
-                "one": 6,
-                "ord": 7,
-                "ueq": 8,
-                "ugt": 9,
-                "uge": 10,
-                "ult": 11,
-                "ule": 12,
-                "une": 13,
-                "uno": 14,
-                "true": 15,
-            }
-            arg = Cmpf._get_comparison_predicate(arg, cmpf_comparison_operations)
+            arg = Cmpf._get_comparison_predicate(arg, _CMPF_COMPARISON_OPERATIONS)
 
         return super().__init__(
             operands=[operand1, operand2],
@@ -19,52 +19,60 @@ def convert_type_or_attr(op: TypeOp | AttributeOp, dialect_name: str) -> str:
     that type or attribute in xDSL.
     """
     type_addition = ", TypeAttribute" if isinstance(op, TypeOp) else ""
-    res = f"""\
+    name = op.sym_name.data
+    res = [
+        f"""\
 @irdl_attr_definition
-class {op.sym_name.data}(ParametrizedAttribute{type_addition}):
-    name = "{dialect_name}.{op.sym_name.data}"
+class {name}(ParametrizedAttribute{type_addition}):
+    name = "{dialect_name}.{name}"
 """
+    ]
 
     for sub_op in op.body.ops:
         if not isinstance(sub_op, ParametersOp):
             continue
         for idx, _ in enumerate(sub_op.args):
-            res += f"    param{idx}: ParameterDef[Attribute]\n"
-    return res
+            res.append(f"    param{idx}: ParameterDef[Attribute]\n")
+    return "".join(res)
 
 
 def convert_op(op: OperationOp, dialect_name: str) -> str:
     """Convert an IRDL operation to Python code creating that operation in xDSL."""
-    res = f"""\
+    name = op.sym_name.data
+    res = [
+        f"""\
 @irdl_op_definition
-class {op.sym_name.data}(IRDLOperation):
-    name = "{dialect_name}.{op.sym_name.data}"
+class {name}(IRDLOperation):
+    name = "{dialect_name}.{name}"
 """
+    ]
 
     for sub_op in op.body.ops:
         if isinstance(sub_op, OperandsOp):
             for idx, _ in enumerate(sub_op.args):
-                res += f"    operand{idx} = operand_def()\n"
+                res.append(f"    operand{idx} = operand_def()\n")
         if isinstance(sub_op, ResultsOp):
             for idx, _ in enumerate(sub_op.args):
-                res += f"    result{idx} = result_def()\n"
-    res += "    regs = var_region_def()\n"
-    res += "    succs = var_successor_def()\n"
-    return res
+                res.append(f"    result{idx} = result_def()\n")
+    res.append("    regs = var_region_def()\n")
+    res.append("    succs = var_successor_def()\n")
+    return "".join(res)
 
 
 def convert_dialect(dialect: DialectOp) -> str:
     """Convert an IRDL dialect to Python code creating that dialect in xDSL."""
-    res = ""
+    dialect_name = dialect.sym_name.data
+    res: list[str] = []
     ops: list[str] = []
     attrs: list[str] = []
     for op in dialect.body.ops:
-        if isinstance(op, TypeOp) or isinstance(op, AttributeOp):
-            res += convert_type_or_attr(op, dialect.sym_name.data) + "\n\n"
-            attrs += [op.sym_name.data]
-        if isinstance(op, OperationOp):
-            res += convert_op(op, dialect.sym_name.data) + "\n\n"
-            ops += [op.sym_name.data]
+        if isinstance(op, TypeOp | AttributeOp):
+            res += (convert_type_or_attr(op, dialect_name), "\n\n")
+            attrs.append(op.sym_name.data)
+        elif isinstance(op, OperationOp):
+            res += (convert_op(op, dialect_name), "\n\n")
+            ops.append(op.sym_name.data)
     op_list = "[" + ", ".join(ops) + "]"
     attr_list = "[" + ", ".join(attrs) + "]"
-    return res + dialect.sym_name.data + f" = Dialect({op_list}, {attr_list})"
+    res.append(dialect_name + f" = Dialect({op_list}, {attr_list})")
+    return "".join(res)
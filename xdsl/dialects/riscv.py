@@ -1357,6 +1357,14 @@ class CsrBitwiseImmOperation(IRDLOperation, RISCVInstruction, ABC):
 ## Integer Register-Immediate Instructions
 
 
+class AddiOpHasCanonicalizationPatternsTrait(HasCanonicalisationPatternsTrait):
+    @classmethod
+    def get_canonicalization_patterns(cls) -> tuple[RewritePattern, ...]:
+        from xdsl.backend.riscv.lowering.optimise_riscv import AddImmediateConstant
+
+        return (AddImmediateConstant(),)
+
+
 @irdl_op_definition
 class AddiOp(RdRsImmIntegerOperation):
     """
@@ -1370,7 +1378,7 @@ class AddiOp(RdRsImmIntegerOperation):
 
     name = "riscv.addi"
 
-    traits = frozenset((Pure(),))
+    traits = frozenset((Pure(), AddiOpHasCanonicalizationPatternsTrait()))
 
 
 @irdl_op_definition
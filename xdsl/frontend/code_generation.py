@@ -1,4 +1,5 @@
 import ast
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -16,6 +17,34 @@ from xdsl.frontend.python_code_check import FunctionMap
 from xdsl.frontend.type_conversion import TypeConverter
 from xdsl.ir import Attribute, Block, Region, SSAValue
 
+_PYTHON_AST_OPERATOR_TO_PYTHON_OVERLOAD: dict[type[ast.operator], str] = {
+    ast.Add: "__add__",
+    ast.Sub: "__sub__",
+    ast.Mult: "__mul__",
+    ast.Div: "__truediv__",
+    ast.FloorDiv: "__floordiv__",
+    ast.Mod: "__mod__",
+    ast.Pow: "__pow__",
+    ast.LShift: "__lshift__",
+    ast.RShift: "__rshift__",
+    ast.BitOr: "__or__",
+    ast.BitXor: "__xor__",
+    ast.BitAnd: "__and__",
+    ast.MatMult: "__matmul__",
+}
+"""Table with mappings of Python AST operator to Python methods."""
+
+_VISITOR_METHODS: dict[
+    tuple[type[ast.NodeVisitor], type[ast.AST]], Callable[[Any, Any], None]
+] = {}
+"""Cache of the visitor method used for each visitor and AST node class."""
+
+_INDEX_ZERO = builtin.IntegerAttr(0, builtin.IndexType())
+"""Default loop start, shared by all generated loops since attributes are immutable."""
+
+_INDEX_ONE = builtin.IntegerAttr(1, builtin.IndexType())
+"""Default loop step, shared by all generated loops since attributes are immutable."""
+
 
 @dataclass
 class CodeGeneration:
@@ -71,17 +100,26 @@ class CodeGenerationVisitor(ast.NodeVisitor):
 
     def get_symbol(self, node: ast.Name) -> Attribute:
         assert self.symbol_table is not None
-        if node.id not in self.symbol_table:
+        symbol_type = self.symbol_table.get(node.id)
+        if symbol_type is None:
             raise CodeGenerationException(
                 self.file,
                 node.lineno,
                 node.col_offset,
                 f"Symbol '{node.id}' is not defined.",
             )
-        return self.symbol_table[node.id]
+        return symbol_type
 
     def visit(self, node: ast.AST) -> None:
-        super().visit(node)
+        # Same dispatch as ast.NodeVisitor.visit, but the visitor method is only
+        # resolved once per (visitor class, node class) pair.
+        key = (type(self), type(node))
+        if (visitor := _VISITOR_METHODS.get(key)) is None:
+            visitor = getattr(
+                type(self), "visit_" + type(node).__name__, type(self).generic_visit
+            )
+            _VISITOR_METHODS[key] = visitor
+        visitor(self, node)
 
     def generic_visit(self, node: ast.AST) -> None:
         raise CodeGenerationException(
@@ -121,24 +159,8 @@ class CodeGenerationVisitor(ast.NodeVisitor):
     def visit_BinOp(self, node: ast.BinOp):
         op_name: str = node.op.__class__.__name__
 
-        # Table with mappings of Python AST operator to Python methods.
-        python_AST_operator_to_python_overload = {
-            "Add": "__add__",
-            "Sub": "__sub__",
-            "Mult": "__mul__",
-            "Div": "__truediv__",
-            "FloorDiv": "__floordiv__",
-            "Mod": "__mod__",
-            "Pow": "__pow__",
-            "LShift": "__lshift__",
-            "RShift": "__rshift__",
-            "BitOr": "__or__",
-            "BitXor": "__xor__",
-            "BitAnd": "__and__",
-            "MatMult": "__matmul__",
-        }
-
-        if op_name not in python_AST_operator_to_python_overload:
+        overload_name = _PYTHON_AST_OPERATOR_TO_PYTHON_OVERLOAD.get(type(node.op))
+        if overload_name is None:
             raise CodeGenerationException(
                 self.file,
                 node.lineno,
@@ -169,7 +191,6 @@ class CodeGenerationVisitor(ast.NodeVisitor):
             lhs.type.__class__
         ]
 
-        overload_name = python_AST_operator_to_python_overload[op_name]
         try:
             op = OpResolver.resolve_op_overload(overload_name, frontend_type)(lhs, rhs)
             self.inserter.insert_op(op)
@@ -330,7 +351,7 @@ class CodeGenerationVisitor(ast.NodeVisitor):
     ) -> tuple[SSAValue, SSAValue, SSAValue]:
         # Process loop start.
         if len(args) <= 1:
-            start = arith.Constant.from_int_and_width(0, builtin.IndexType())
+            start = arith.Constant(_INDEX_ZERO)
             self.inserter.insert_op(start)
         else:
             self.visit(args[0])
@@ -362,7 +383,7 @@ class CodeGenerationVisitor(ast.NodeVisitor):
         if len(args) == 3:
             self.visit(args[2])
         else:
-            step = arith.Constant.from_int_and_width(1, builtin.IndexType())
+            step = arith.Constant(_INDEX_ONE)
             self.inserter.insert_op(step)
         step = self.inserter.get_operand()
         if not isinstance(step.type, builtin.IndexType):
@@ -466,20 +487,19 @@ class CodeGenerationVisitor(ast.NodeVisitor):
         self.symbol_table = dict()
 
         # Then, convert types in the function signature.
+        convert_type_hint = self.type_converter.convert_type_hint
         argument_types: list[Attribute] = []
-        for i, arg in enumerate(node.args.args):
+        for arg in node.args.args:
             if arg.annotation is None:
                 raise CodeGenerationException(self.file, arg.lineno, arg.col_offset, "")
-            xdsl_type = self.type_converter.convert_type_hint(arg.annotation)
-            argument_types.append(xdsl_type)
+            argument_types.append(convert_type_hint(arg.annotation))
 
-        return_types: list[Attribute] = []
-        if node.returns is not None:
-            xdsl_type = self.type_converter.convert_type_hint(node.returns)
-            return_types.append(xdsl_type)
+        return_types: list[Attribute] = (
+            [] if node.returns is None else [convert_type_hint(node.returns)]
+        )
 
         # Create a function operation.
-        entry_block = Block()
+        entry_block = Block(arg_types=argument_types)
         body_region = Region(entry_block)
         func_op = func.FuncOp.from_region(
             node.name, argument_types, return_types, body_region
@@ -489,12 +509,16 @@ class CodeGenerationVisitor(ast.NodeVisitor):
         self.inserter.set_insertion_point_from_block(entry_block)
 
         # All arguments are declared using symref.
-        for i, arg in enumerate(node.args.args):
-            symbol_name = str(arg.arg)
-            block_arg = entry_block.insert_arg(argument_types[i], i)
-            self.symbol_table[symbol_name] = argument_types[i]
-            entry_block.add_op(symref.Declare.get(symbol_name))
-            entry_block.add_op(symref.Update.get(symbol_name, block_arg))
+        symbol_names = [str(arg.arg) for arg in node.args.args]
+        self.symbol_table.update(zip(symbol_names, argument_types))
+        entry_block.add_ops(
+            op
+            for symbol_name, block_arg in zip(symbol_names, entry_block.args)
+            for op in (
+                symref.Declare.get(symbol_name),
+                symref.Update.get(symbol_name, block_arg),
+            )
+        )
 
         # Parse function body.
         for stmt in node.body:
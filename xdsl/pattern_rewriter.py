@@ -9,10 +9,12 @@ from types import UnionType
 from typing import (
     TypeVar,
     Union,
+    cast,
     final,
     get_args,
     get_origin,
 )
+from weakref import WeakKeyDictionary
 
 from xdsl.dialects.builtin import ArrayAttr, ModuleOp
 from xdsl.ir import (
@@ -28,7 +30,7 @@ from xdsl.rewriter import Rewriter
 from xdsl.utils.hints import isa
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class PatternRewriter:
     """
     A rewriter used during pattern matching.
@@ -407,6 +409,14 @@ class RewritePattern(ABC):
 _RewritePatternT = TypeVar("_RewritePatternT", bound=RewritePattern)
 _OperationT = TypeVar("_OperationT", bound=Operation)
 
+_OP_TYPE_REWRITE_PATTERN_TYPES: WeakKeyDictionary[
+    Callable[..., None], tuple[type[Operation], ...]
+] = WeakKeyDictionary()
+"""
+The operation types matched by each method decorated with `op_type_rewrite_pattern`,
+used to skip patterns that can never match a given operation type.
+"""
+
 
 def op_type_rewrite_pattern(
     func: Callable[[_RewritePatternT, _OperationT, PatternRewriter], None]
@@ -417,26 +427,18 @@ def op_type_rewrite_pattern(
     calling the decorated function.
     """
     # Get the operation argument and check that it is a subclass of Operation
-    params = [param for param in inspect.signature(func).parameters.values()]
+    params = tuple(inspect.signature(func).parameters.values())
     if len(params) != 3:
         raise Exception(
             "op_type_rewrite_pattern expects the decorated function to "
             "have two non-self arguments."
         )
-    is_method = params[0].name == "self"
-    if is_method:
-        if len(params) != 3:
-            raise Exception(
-                "op_type_rewrite_pattern expects the decorated method to "
-                "have two non-self arguments."
-            )
-    else:
-        if len(params) != 2:
-            raise Exception(
-                "op_type_rewrite_pattern expects the decorated function to "
-                "have two arguments."
-            )
-    expected_type: type[_OperationT] = params[-2].annotation
+    if params[0].name != "self":
+        raise Exception(
+            "op_type_rewrite_pattern expects the decorated function to "
+            "have two arguments."
+        )
+    expected_type: type[_OperationT] = params[1].annotation
 
     expected_types = (expected_type,)
     if get_origin(expected_type) in [Union, UnionType]:
@@ -450,12 +452,26 @@ def op_type_rewrite_pattern(
         )
 
     def impl(self: _RewritePatternT, op: Operation, rewriter: PatternRewriter) -> None:
-        if isinstance(op, expected_type):
-            func(self, op, rewriter)
+        if isinstance(op, expected_types):
+            # The isinstance check against the expected types guarantees the cast
+            func(self, cast(_OperationT, op), rewriter)
 
+    _OP_TYPE_REWRITE_PATTERN_TYPES[impl] = expected_types
     return impl
 
 
+def pattern_may_match(pattern: RewritePattern, op_type: type[Operation]) -> bool:
+    """
+    Returns False if the pattern is known to never match operations of the given type,
+    which is the case for `op_type_rewrite_pattern` patterns on other types, and for
+    greedy appliers of such patterns only.
+    """
+    if isinstance(pattern, GreedyRewritePatternApplier):
+        return bool(pattern.patterns_for(op_type))
+    expected_types = _OP_TYPE_REWRITE_PATTERN_TYPES.get(type(pattern).match_and_rewrite)
+    return expected_types is None or issubclass(op_type, expected_types)
+
+
 @dataclass
 class TypeConversionPattern(RewritePattern):
     """
@@ -594,8 +610,28 @@ class GreedyRewritePatternApplier(RewritePattern):
     rewrite_patterns: list[RewritePattern]
     """The list of rewrites to apply in order."""
 
+    _patterns_by_op_type: dict[type[Operation], list[RewritePattern]] = field(
+        default_factory=dict, init=False
+    )
+    """
+    The rewrites that may match each operation type, in order. Patterns that are only
+    defined on other operation types are skipped without being called.
+    """
+
+    def patterns_for(self, op_type: type[Operation]) -> list[RewritePattern]:
+        """Returns the rewrites that may match operations of the given type, in order."""
+        patterns = self._patterns_by_op_type.get(op_type)
+        if patterns is None:
+            patterns = [
+                pattern
+                for pattern in self.rewrite_patterns
+                if pattern_may_match(pattern, op_type)
+            ]
+            self._patterns_by_op_type[op_type] = patterns
+        return patterns
+
     def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter) -> None:
-        for pattern in self.rewrite_patterns:
+        for pattern in self.patterns_for(type(op)):
             pattern.match_and_rewrite(op, rewriter)
             if rewriter.has_done_action:
                 return
@@ -629,6 +665,14 @@ class PatternRewriteWalker:
     That way, all uses are replaced before the definitions.
     """
 
+    _may_match_op_type: dict[type[Operation], bool] = field(
+        default_factory=dict, init=False
+    )
+    """
+    Whether the pattern may match each operation type. Operations of other types are
+    walked without creating a rewriter or calling the pattern.
+    """
+
     def rewrite_module(self, op: ModuleOp):
         """Rewrite an entire module operation."""
         self._rewrite_op(op)
@@ -645,6 +689,18 @@ class PatternRewriteWalker:
         prev_op = op.prev_op
         next_op = op.next_op
 
+        op_type = type(op)
+        may_match = self._may_match_op_type.get(op_type)
+        if may_match is None:
+            may_match = pattern_may_match(self.pattern, op_type)
+            self._may_match_op_type[op_type] = may_match
+
+        # Operations that the pattern can never match only have their regions walked
+        if not may_match:
+            if not self.walk_regions_first:
+                self._rewrite_op_regions(op)
+            return prev_op if self.walk_reverse else next_op
+
         # We then match for a pattern in the current operation
         rewriter = PatternRewriter(op)
         self.pattern.match_and_rewrite(op, rewriter)
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from abc import ABC
 from collections.abc import Sequence
-from dataclasses import dataclass
-from typing import Any, TypeGuard, cast
+from dataclasses import dataclass, field
+from typing import cast
 
 from immutabledict import immutabledict
 
@@ -20,7 +20,7 @@ from xdsl.utils.exceptions import InvalidIRException
 from xdsl.utils.immutable_list import IList
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ISSAValue(ABC):
     """
     Represents an immutable SSA variable. An immutable SSA variable is either an operation result
@@ -46,52 +46,36 @@ class ISSAValue(ABC):
         self.users.freeze()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class IOpResult(ISSAValue):
-    """Represents an immutable SSA variable defined by an operation result."""
+    """
+    Represents an immutable SSA variable defined by an operation result.
+    Each IOperation creates exactly one IOpResult per result, so results are
+    compared and hashed by identity.
+    """
 
     op: IOperation
     index: int
 
-    def __hash__(self) -> int:
-        return hash(id(self.op)) + hash(self.index)
-
-    def __eq__(self, __o: object) -> bool:
-        if isinstance(__o, IOpResult):
-            return self.op == __o.op and self.index == __o.index
-        return False
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class IBlockArg(ISSAValue):
     """Represents an immutable SSA variable defined by a basic block."""
 
     block: IBlock
     index: int
 
-    def __hash__(self) -> int:
-        return hash(id(self.block)) + hash(self.index)
-
-    def __eq__(self, __o: IBlockArg) -> bool:
-        return self is __o
-
     def __repr__(self) -> str:
         return "BlockArg(type:" + self.type.name + ("attached") + ")"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class IRegion:
     """An immutable region contains a CFG of immutable blocks. IRegions are contained in operations."""
 
-    blocks: IList[IBlock]
+    blocks: tuple[IBlock, ...]
     """Immutable blocks contained in the IRegion. The first block is the entry block."""
 
-    def __hash__(self) -> int:
-        return hash(id(self))
-
-    def __eq__(self, __o: object) -> bool:
-        return self is __o
-
     @property
     def block(self) -> IBlock:
         """
@@ -106,7 +90,7 @@ class IRegion:
         return self.blocks[0]
 
     @property
-    def ops(self) -> IList[IOperation]:
+    def ops(self) -> tuple[IOperation, ...]:
         """
         Get the operations of a single-block region.
         Returns an exception if the region is not single-block.
@@ -121,8 +105,7 @@ class IRegion:
     def __init__(self, blocks: Sequence[IBlock]):
         """Creates a new immutable region from a sequence of immutable blocks."""
 
-        object.__setattr__(self, "blocks", IList(blocks))
-        self.blocks.freeze()
+        object.__setattr__(self, "blocks", tuple(blocks))
 
     @classmethod
     def from_mutable(
@@ -170,11 +153,9 @@ class IRegion:
                         object.__setattr__(
                             op,
                             "successors",
-                            IList(
-                                op.successors[:dummy_index]
-                                + [imm_block]
-                                + op.successors[dummy_index + 1 :]
-                            ),
+                            op.successors[:dummy_index]
+                            + (imm_block,)
+                            + op.successors[dummy_index + 1 :],
                         )
 
         return region
@@ -205,23 +186,17 @@ class IRegion:
         return Region(mutable_blocks)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class IBlock:
     """An immutable block contains a list of immutable operations. IBlocks are contained in IRegions."""
 
-    args: IList[IBlockArg]
-    ops: IList[IOperation]
+    args: tuple[IBlockArg, ...]
+    ops: tuple[IOperation, ...]
+    _arg_types: tuple[Attribute, ...] = field(init=False, repr=False, compare=False)
 
     @property
-    def arg_types(self) -> list[Attribute]:
-        frozen_arg_types = [arg.type for arg in self.args]
-        return frozen_arg_types
-
-    def __hash__(self) -> int:
-        return id(self)
-
-    def __eq__(self, __o: object) -> bool:
-        return self is __o
+    def arg_types(self) -> tuple[Attribute, ...]:
+        return self._arg_types
 
     def __repr__(self) -> str:
         return (
@@ -237,29 +212,24 @@ class IBlock:
     ):
         """Creates a new immutable block."""
 
-        # Type Guards:
-        def is_iblock_arg_seq(list: Sequence[Any]) -> TypeGuard[Sequence[IBlockArg]]:
-            return all([isinstance(elem, IBlockArg) for elem in list])
-
-        def is_type_seq(list: Sequence[Any]) -> TypeGuard[Sequence[Attribute]]:
-            return all([isinstance(elem, Attribute) for elem in list])
-
-        if is_type_seq(args):
-            block_args: Sequence[IBlockArg] = [
-                IBlockArg(type, IList(()), self, idx) for idx, type in enumerate(args)
-            ]
-        elif is_iblock_arg_seq(args):
-            block_args: Sequence[IBlockArg] = args
-            for block_arg in block_args:
+        # The first element decides how args are interpreted, the remaining
+        # elements are checked while building the block arguments.
+        block_args: list[IBlockArg] = []
+        if args and isinstance(args[0], IBlockArg):
+            for block_arg in args:
+                if not isinstance(block_arg, IBlockArg):
+                    raise Exception("args for IBlock ill structured")
                 object.__setattr__(block_arg, "block", self)
+                block_args.append(block_arg)
         else:
-            raise Exception("args for IBlock ill structured")
-
-        object.__setattr__(self, "args", IList(block_args))
-        object.__setattr__(self, "ops", IList(ops))
+            for idx, type in enumerate(args):
+                if not isinstance(type, Attribute):
+                    raise Exception("args for IBlock ill structured")
+                block_args.append(IBlockArg(type, IList(()), self, idx))
 
-        self.args.freeze()
-        self.ops.freeze()
+        object.__setattr__(self, "args", tuple(block_args))
+        object.__setattr__(self, "ops", tuple(ops))
+        object.__setattr__(self, "_arg_types", tuple(arg.type for arg in self.args))
 
     @classmethod
     def from_mutable(
@@ -316,9 +286,7 @@ class IBlock:
             block_mapping = {}
 
         # Block might already have been created by the Region, look it up
-        if self in block_mapping:
-            mutable_block = block_mapping[self]
-        else:
+        if (mutable_block := block_mapping.get(self)) is None:
             mutable_block = Block(arg_types=self.arg_types)
         for idx, arg in enumerate(self.args):
             value_mapping[arg] = mutable_block.args[idx]
@@ -337,7 +305,7 @@ def get_immutable_copy(op: Operation) -> IOperation:
     return IOperation.from_mutable(op)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class IOperation:
     """Represents an immutable operation."""
 
@@ -345,10 +313,11 @@ class IOperation:
     name: str
     op_type: type[Operation]
     attributes: immutabledict[str, Attribute]
-    operands: IList[ISSAValue]
-    results: IList[IOpResult]
-    successors: IList[IBlock]
-    regions: IList[IRegion]
+    operands: tuple[ISSAValue, ...]
+    results: tuple[IOpResult, ...]
+    successors: tuple[IBlock, ...]
+    regions: tuple[IRegion, ...]
+    _result_types: tuple[Attribute, ...] = field(init=False, repr=False, compare=False)
 
     def __init__(
         self,
@@ -363,26 +332,20 @@ class IOperation:
         object.__setattr__(self, "name", name)
         object.__setattr__(self, "op_type", op_type)
         object.__setattr__(self, "attributes", attributes)
-        object.__setattr__(self, "operands", IList(operands))
+        object.__setattr__(self, "operands", tuple(operands))
         for operand in operands:
             operand._add_user(self)  # pyright: ignore[reportPrivateUsage]
+        object.__setattr__(self, "_result_types", tuple(result_types))
         object.__setattr__(
             self,
             "results",
-            IList(
-                [
-                    IOpResult(type, IList(()), self, idx)
-                    for idx, type in enumerate(result_types)
-                ]
+            tuple(
+                IOpResult(type, IList(()), self, idx)
+                for idx, type in enumerate(self._result_types)
             ),
         )
-        object.__setattr__(self, "successors", IList(successors))
-        object.__setattr__(self, "regions", IList(regions))
-
-        self.operands.freeze()
-        self.results.freeze()
-        self.successors.freeze()
-        self.regions.freeze()
+        object.__setattr__(self, "successors", tuple(successors))
+        object.__setattr__(self, "regions", tuple(regions))
 
     @classmethod
     def get(
@@ -399,12 +362,6 @@ class IOperation:
             name, op_type, attributes, operands, result_types, successors, regions
         )
 
-    def __hash__(self) -> int:
-        return hash(id(self))
-
-    def __eq__(self, __o: object) -> bool:
-        return self is __o
-
     @property
     def result(self) -> IOpResult:
         """
@@ -432,8 +389,8 @@ class IOperation:
         return self.regions[0]
 
     @property
-    def result_types(self) -> list[Attribute]:
-        return [result.type for result in self.results]
+    def result_types(self) -> tuple[Attribute, ...]:
+        return self._result_types
 
     def to_mutable(
         self,
@@ -451,9 +408,10 @@ class IOperation:
             block_mapping = {}
 
         mutable_operands: list[SSAValue] = []
+        get_value = value_mapping.get
         for operand in self.operands:
-            if operand in value_mapping:
-                mutable_operands.append(value_mapping[operand])
+            if (mutable_operand := get_value(operand)) is not None:
+                mutable_operands.append(mutable_operand)
             else:
                 print(f"ERROR: op {self.name} uses SSAValue before definition")
                 # Continuing to enable printing the IR including missing
@@ -463,9 +421,10 @@ class IOperation:
                 )
 
         mutable_successors: list[Block] = []
+        get_block = block_mapping.get
         for successor in self.successors:
-            if successor in block_mapping:
-                mutable_successors.append(block_mapping[successor])
+            if (mutable_successor := get_block(successor)) is not None:
+                mutable_successors.append(mutable_successor)
             else:
                 raise InvalidIRException(
                     "Invalid IR: Block is not defined in the current region"
@@ -481,8 +440,8 @@ class IOperation:
 
         new_op: Operation = self.op_type.create(
             operands=mutable_operands,
-            result_types=[result.type for result in self.results],
-            attributes=dict(self.attributes),
+            result_types=self._result_types,
+            attributes=self.attributes,
             successors=mutable_successors,
             regions=mutable_regions,
         )
@@ -518,40 +477,39 @@ class IOperation:
 
         operands: list[ISSAValue] = []
         if existing_operands is None:
+            get_value = value_map.get
             for operand in op.operands:
-                if isinstance(operand, OpResult):
-                    if operand in value_map:
-                        operands.append(value_map[operand])
-                    else:
+                # Only dispatch on the operand kind to report a missing mapping
+                if (immutable_operand := get_value(operand)) is None:
+                    if isinstance(operand, OpResult):
                         raise Exception("Operand used before definition")
-                elif isinstance(operand, BlockArgument):
-                    if operand not in value_map:
+                    if isinstance(operand, BlockArgument):
                         raise Exception(
                             "Block argument expected in mapping for op: " + op.name
                         )
-                    operands.append(value_map[operand])
-                else:
                     raise Exception(
                         "Operand is expected to be either OpResult or BlockArgument"
                     )
+                operands.append(immutable_operand)
         else:
             operands.extend(existing_operands)
 
         attributes: immutabledict[str, Attribute] = immutabledict(op.attributes)
 
         successors: list[IBlock] = []
+        get_block = block_map.get
         for successor in op.successors:
-            if successor in block_map:
-                successors.append(block_map[successor])
-            else:
+            if (immutable_successor := get_block(successor)) is None:
                 raise Exception(
                     "Successor not defined in current region, `from_mutable`\
                           probably has to be called on the parent operation."
                 )
+            successors.append(immutable_successor)
 
-        regions: list[IRegion] = []
-        for region in op.regions:
-            regions.append(IRegion.from_mutable(region.blocks, value_map, block_map))
+        regions = [
+            IRegion.from_mutable(region.blocks, value_map, block_map)
+            for region in op.regions
+        ]
 
         immutable_op = IOperation.get(
             op.name,
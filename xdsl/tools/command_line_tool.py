@@ -4,71 +4,46 @@ import sys
 from collections.abc import Callable
 from typing import IO
 
-from xdsl.backend.riscv import riscv_scf_to_asm
-from xdsl.backend.riscv.lowering import (
-    convert_arith_to_riscv,
-    convert_func_to_riscv_func,
-    convert_memref_to_riscv,
-    convert_scf_to_riscv_scf,
-    reduce_register_pressure,
-)
-from xdsl.dialects.affine import Affine
-from xdsl.dialects.arith import Arith
-from xdsl.dialects.builtin import Builtin, ModuleOp
-from xdsl.dialects.cf import Cf
-from xdsl.dialects.cmath import CMath
-from xdsl.dialects.experimental.dmp import DMP
-from xdsl.dialects.experimental.fir import FIR
-from xdsl.dialects.experimental.math import Math
-from xdsl.dialects.func import Func
-from xdsl.dialects.gpu import GPU
-from xdsl.dialects.irdl.irdl import IRDL
-from xdsl.dialects.linalg import Linalg
-from xdsl.dialects.llvm import LLVM
-from xdsl.dialects.memref import MemRef
-from xdsl.dialects.mpi import MPI
-from xdsl.dialects.pdl import PDL
-from xdsl.dialects.printf import Printf
-from xdsl.dialects.riscv import RISCV
-from xdsl.dialects.riscv_func import RISCV_Func
-from xdsl.dialects.riscv_scf import RISCV_Scf
-from xdsl.dialects.scf import Scf
-from xdsl.dialects.snitch import Snitch
-from xdsl.dialects.snitch_runtime import SnitchRuntime
-from xdsl.dialects.stencil import Stencil
-from xdsl.dialects.test import Test
-from xdsl.dialects.vector import Vector
-from xdsl.frontend.passes.desymref import DesymrefyPass
-from xdsl.frontend.symref import Symref
+from xdsl.dialects.builtin import ModuleOp
 from xdsl.ir import Dialect, MLContext
 from xdsl.parser import Parser
 from xdsl.passes import ModulePass
-from xdsl.transforms import (
-    canonicalize,
-    canonicalize_dmp,
-    dead_code_elimination,
-    lower_affine,
-    lower_mpi,
-    lower_riscv_func,
-    lower_snitch,
-    lower_snitch_runtime,
-    mlir_opt,
-    printf_to_llvm,
-    printf_to_putchar,
-    reconcile_unrealized_casts,
-    riscv_register_allocation,
-)
-from xdsl.transforms.experimental import (
-    convert_stencil_to_ll_mlir,
-    stencil_shape_inference,
-    stencil_storage_materialization,
-)
-from xdsl.transforms.experimental.dmp import stencil_global_to_local
 from xdsl.utils.exceptions import ParseError
 
 
 def get_all_dialects() -> list[Dialect]:
-    """Return the list of all available dialects."""
+    """
+    Return the list of all available dialects.
+    The dialects are only imported when this is called, not when importing this module.
+    """
+    from xdsl.dialects.affine import Affine
+    from xdsl.dialects.arith import Arith
+    from xdsl.dialects.builtin import Builtin
+    from xdsl.dialects.cf import Cf
+    from xdsl.dialects.cmath import CMath
+    from xdsl.dialects.experimental.dmp import DMP
+    from xdsl.dialects.experimental.fir import FIR
+    from xdsl.dialects.experimental.math import Math
+    from xdsl.dialects.func import Func
+    from xdsl.dialects.gpu import GPU
+    from xdsl.dialects.irdl.irdl import IRDL
+    from xdsl.dialects.linalg import Linalg
+    from xdsl.dialects.llvm import LLVM
+    from xdsl.dialects.memref import MemRef
+    from xdsl.dialects.mpi import MPI
+    from xdsl.dialects.pdl import PDL
+    from xdsl.dialects.printf import Printf
+    from xdsl.dialects.riscv import RISCV
+    from xdsl.dialects.riscv_func import RISCV_Func
+    from xdsl.dialects.riscv_scf import RISCV_Scf
+    from xdsl.dialects.scf import Scf
+    from xdsl.dialects.snitch import Snitch
+    from xdsl.dialects.snitch_runtime import SnitchRuntime
+    from xdsl.dialects.stencil import Stencil
+    from xdsl.dialects.test import Test
+    from xdsl.dialects.vector import Vector
+    from xdsl.frontend.symref import Symref
+
     return [
         Affine,
         Arith,
@@ -101,7 +76,41 @@ def get_all_dialects() -> list[Dialect]:
 
 
 def get_all_passes() -> list[type[ModulePass]]:
-    """Return the list of all available passes."""
+    """
+    Return the list of all available passes.
+    The passes are only imported when this is called, not when importing this module.
+    """
+    from xdsl.backend.riscv import riscv_scf_to_asm
+    from xdsl.backend.riscv.lowering import (
+        convert_arith_to_riscv,
+        convert_func_to_riscv_func,
+        convert_memref_to_riscv,
+        convert_scf_to_riscv_scf,
+        reduce_register_pressure,
+    )
+    from xdsl.frontend.passes.desymref import DesymrefyPass
+    from xdsl.transforms import (
+        canonicalize,
+        canonicalize_dmp,
+        dead_code_elimination,
+        lower_affine,
+        lower_mpi,
+        lower_riscv_func,
+        lower_snitch,
+        lower_snitch_runtime,
+        mlir_opt,
+        printf_to_llvm,
+        printf_to_putchar,
+        reconcile_unrealized_casts,
+        riscv_register_allocation,
+    )
+    from xdsl.transforms.experimental import (
+        convert_stencil_to_ll_mlir,
+        stencil_shape_inference,
+        stencil_storage_materialization,
+    )
+    from xdsl.transforms.experimental.dmp import stencil_global_to_local
+
     return [
         canonicalize.CanonicalizePass,
         canonicalize_dmp.CanonicalizeDmpPass,
@@ -223,6 +232,7 @@ class CommandLineTool:
         Parse the input file by invoking the parser specified by the `parser`
         argument. If not set, the parser registered for this file extension
         is used.
+        The chunk is not closed, as its lifetime is owned by the caller.
         """
 
         try:
@@ -232,5 +242,3 @@ class CommandLineTool:
                 print(e.with_context())
             else:
                 raise Exception("Failed to parse:\n" + e.with_context()) from e
-        finally:
-            chunk.close()
@@ -37,12 +37,12 @@ def main():
     else:
         file = open(args.output_file, "w")
 
-    # Output the Python code
-    print("from xdsl.irdl import *", file=file)
-    print("from xdsl.ir import *\n\n", file=file)
+    # Output the Python code, written at once rather than line by line
+    output = ["from xdsl.irdl import *\n", "from xdsl.ir import *\n\n\n"]
     for op in module.walk():
         if isinstance(op, DialectOp):
-            print(convert_dialect(op), file=file)
+            output += (convert_dialect(op), "\n")
+    file.write("".join(output))
 
 
 if __name__ == "__main__":